@@ -138,6 +138,12 @@ def compileInterpolatableTTFs(ufos, **kwargs):
     all UFO's "public.skipExportGlyphs" lib keys will be used. If they don't
     exist, all glyphs are exported. UFO groups and kerning will be pruned of
     skipped glyphs.
+
+    *numProcesses* (int) is the number of worker processes used to compile the
+    UFOs in parallel after they have been preprocessed together. It must be at
+    least 1; the default (1) compiles them one after the other. The UFO objects
+    must be picklable for this to work (e.g. ufoLib2 fonts; defcon fonts are
+    not), otherwise a ValueError is raised.
     """
     return InterpolatableTTFCompiler(**kwargs).compile(ufos)
 
@@ -1,5 +1,8 @@
+import copy
 import logging
+import pickle
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Callable, Optional, Type
 
@@ -106,6 +109,18 @@ class BaseCompiler:
             ttf = postProcessor.process(**kwargs)
         return ttf
 
+    def _setFeatureCompilerClass(self, ufo):
+        """Pick the feature compiler class from `ufo`, unless one was given
+        explicitly or already picked for a previous UFO."""
+        if self.featureCompilerClass is None:
+            if any(
+                fn.startswith(MTI_FEATURES_PREFIX) and fn.endswith(".mti")
+                for fn in ufo.data.fileNames
+            ):
+                self.featureCompilerClass = MtiFeatureCompiler
+            else:
+                self.featureCompilerClass = FeatureCompiler
+
     def compileFeatures(
         self,
         ufo,
@@ -129,14 +144,7 @@ class BaseCompiler:
         in which to dump the text content of the feature file, useful for debugging
         auto-generated OpenType features like kern, mark, mkmk etc.
         """
-        if self.featureCompilerClass is None:
-            if any(
-                fn.startswith(MTI_FEATURES_PREFIX) and fn.endswith(".mti")
-                for fn in ufo.data.fileNames
-            ):
-                self.featureCompilerClass = MtiFeatureCompiler
-            else:
-                self.featureCompilerClass = FeatureCompiler
+        self._setFeatureCompilerClass(ufo)
 
         kwargs = prune_unknown_kwargs(self.__dict__, self.featureCompilerClass)
         featureCompiler = self.featureCompilerClass(
@@ -151,6 +159,36 @@ class BaseCompiler:
         return otFont
 
 
+def _pickle_source(ufo, glyphSet, layerName, numProcesses):
+    try:
+        return pickle.dumps((ufo, glyphSet), pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        error = e
+    # Find out which of the two objects can't be pickled, for the error message
+    name = str(_LazyFontName(ufo))
+    if layerName is not None:
+        name = f"{name}-{layerName}"
+    culprit, description = ufo, f"UFO of source {name}"
+    try:
+        pickle.dumps(ufo, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        pass
+    else:
+        culprit, description = glyphSet, f"glyph set of source {name}"
+    raise ValueError(
+        f"numProcesses={numProcesses} requires picklable sources (e.g. ufoLib2 "
+        f"fonts), but the {description} ({type(culprit).__module__}."
+        f"{type(culprit).__qualname__}) could not be pickled: {error}"
+    ) from error
+
+
+def _compile_one(compiler, source, layerName, isDefaultSource):
+    # Module-level function so it can be pickled and run in a worker process
+    ufo, glyphSet = pickle.loads(source)
+    compiler.compilingVFDefaultSource = isDefaultSource
+    return compiler.compile_one(ufo, glyphSet, layerName)
+
+
 @dataclass
 class BaseInterpolatableCompiler(BaseCompiler):
     """Create FontTools TrueType fonts from the DesignSpaceDocument UFO sources
@@ -176,10 +214,16 @@ class BaseInterpolatableCompiler(BaseCompiler):
     For sources that have the 'layerName' attribute defined, the corresponding TTFont
     object will contain only a minimum set of tables ("head", "hmtx", "glyf", "loca",
     "maxp", "post" and "vmtx"), and no OpenType layout tables.
+
+    When *numProcesses* is greater than 1, the preprocessed sources are compiled
+    in parallel using a pool of that many worker processes. This requires the UFO
+    font objects to be picklable (ufoLib2 fonts are, defcon fonts are not);
+    otherwise a ValueError is raised.
     """
 
     extraSubstitutions: Optional[dict] = None
     variableFontNames: Optional[list] = None
+    numProcesses: int = 1
 
     # used to generate glyph instances on-the-fly (e.g. decomposing sparse composites)
     instantiator: Optional[Instantiator] = field(init=False, default=None)
@@ -187,6 +231,13 @@ class BaseInterpolatableCompiler(BaseCompiler):
     # or not: e.g. handling of composite glyphs pointing to missing components.
     compilingVFDefaultSource: bool = field(init=False, default=True)
 
+    def __post_init__(self):
+        super().__post_init__()
+        if self.numProcesses < 1:
+            raise ValueError(
+                f"numProcesses must be at least 1, got {self.numProcesses}"
+            )
+
     def compile(self, ufos):
         if self.layerNames is None:
             self.layerNames = [None] * len(ufos)
@@ -196,13 +247,50 @@ class BaseInterpolatableCompiler(BaseCompiler):
         default_idx = (
             self.instantiator.default_source_idx if self.instantiator else None
         )
-        for i, (ufo, glyphSet, layerName) in enumerate(
-            zip(ufos, self.glyphSets, self.layerNames)
+        if default_idx is None:
+            isDefaultSource = [self.compilingVFDefaultSource] * len(ufos)
+        else:
+            isDefaultSource = [i == default_idx for i in range(len(ufos))]
+
+        if self.numProcesses > 1 and len(ufos) > 1 and not self.debugFeatureFile:
+            yield from self._compile_parallel(ufos, isDefaultSource)
+            return
+
+        for ufo, glyphSet, layerName, isDefault in zip(
+            ufos, self.glyphSets, self.layerNames, isDefaultSource
         ):
-            if default_idx is not None:
-                self.compilingVFDefaultSource = i == default_idx
+            self.compilingVFDefaultSource = isDefault
             yield self.compile_one(ufo, glyphSet, layerName)
 
+    def _compile_parallel(self, ufos, isDefaultSource):
+        # Pick the feature compiler here, from the first UFO whose features get
+        # compiled, as compile_one would when compiling serially. Otherwise each
+        # worker would pick one from its own UFO.
+        if not self.skipFeatureCompilation:
+            for ufo, layerName in zip(ufos, self.layerNames):
+                if layerName is None:
+                    self._setFeatureCompilerClass(ufo)
+                    break
+        # The workers receive a pickled copy of the compiler, so leave out the
+        # state that is only needed for preprocessing all the sources together.
+        worker = copy.copy(self)
+        worker.glyphSets = None
+        worker.instantiator = None
+        # Pickle the sources here rather than in the executor, so that sources
+        # which can't be sent to the workers fail with a meaningful error.
+        sources = [
+            _pickle_source(ufo, glyphSet, layerName, self.numProcesses)
+            for ufo, glyphSet, layerName in zip(ufos, self.glyphSets, self.layerNames)
+        ]
+        with ProcessPoolExecutor(self.numProcesses) as executor:
+            yield from executor.map(
+                _compile_one,
+                [worker] * len(ufos),
+                sources,
+                self.layerNames,
+                isDefaultSource,
+            )
+
     def compile_one(self, ufo, glyphSet, layerName):
         fontName = _LazyFontName(ufo)
         if layerName is not None:
@@ -1,26 +1,36 @@
 import importlib
 import logging
+from functools import lru_cache
 from inspect import getfullargspec, isclass
+from weakref import WeakKeyDictionary
 
 from ufo2ft.constants import FILTERS_KEY
 from ufo2ft.util import _loadPluginFromString
 
 from .base import BaseFilter, BaseIFilter
-from .cubicToQuadratic import CubicToQuadraticFilter
-from .decomposeComponents import DecomposeComponentsFilter, DecomposeComponentsIFilter
-from .decomposeTransformedComponents import (
-    DecomposeTransformedComponentsFilter,
-    DecomposeTransformedComponentsIFilter,
-)
-from .dottedCircle import DottedCircleFilter
-from .explodeColorLayerGlyphs import ExplodeColorLayerGlyphsFilter
-from .flattenComponents import FlattenComponentsFilter, FlattenComponentsIFilter
-from .propagateAnchors import PropagateAnchorsFilter, PropagateAnchorsIFilter
-from .removeOverlaps import RemoveOverlapsFilter
-from .reverseContourDirection import ReverseContourDirectionFilter
-from .skipExportGlyphs import SkipExportGlyphsFilter, SkipExportGlyphsIFilter
-from .sortContours import SortContoursFilter
-from .transformations import TransformationsFilter
+
+# The built-in filter classes are only imported from their modules when they
+# are first accessed, so that importing this package does not pull in all of
+# them along with their dependencies.
+_lazyFilterModules = {
+    "CubicToQuadraticFilter": "cubicToQuadratic",
+    "DecomposeComponentsFilter": "decomposeComponents",
+    "DecomposeComponentsIFilter": "decomposeComponents",
+    "DecomposeTransformedComponentsFilter": "decomposeTransformedComponents",
+    "DecomposeTransformedComponentsIFilter": "decomposeTransformedComponents",
+    "DottedCircleFilter": "dottedCircle",
+    "ExplodeColorLayerGlyphsFilter": "explodeColorLayerGlyphs",
+    "FlattenComponentsFilter": "flattenComponents",
+    "FlattenComponentsIFilter": "flattenComponents",
+    "PropagateAnchorsFilter": "propagateAnchors",
+    "PropagateAnchorsIFilter": "propagateAnchors",
+    "RemoveOverlapsFilter": "removeOverlaps",
+    "ReverseContourDirectionFilter": "reverseContourDirection",
+    "SkipExportGlyphsFilter": "skipExportGlyphs",
+    "SkipExportGlyphsIFilter": "skipExportGlyphs",
+    "SortContoursFilter": "sortContours",
+    "TransformationsFilter": "transformations",
+}
 
 __all__ = [
     "BaseFilter",
@@ -50,10 +60,34 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+_lazySubmodules = frozenset(_lazyFilterModules.values())
+
+
+def __getattr__(name):
+    if name in _lazySubmodules:
+        # Importing a submodule also binds it as an attribute of this package
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        moduleName = _lazyFilterModules[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{moduleName}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyFilterModules) | _lazySubmodules)
+
+
+@lru_cache(maxsize=None)
 def getFilterClass(filterName, pkg="ufo2ft.filters"):
     """Given a filter name, import and return the filter class.
     By default, filter modules are searched within the ``ufo2ft.filters``
     package.
+
+    Successful lookups are cached, so loading the same filters for many
+    UFOs only imports each filter module once.
     """
     # TODO add support for third-party plugin discovery?
     # if filter name is 'Foo Bar', the module should be called 'fooBar'
@@ -96,6 +130,18 @@ def loadFilters(ufo):
     return preFilters, postFilters
 
 
+# The positional argument names of each filter class's '__call__' method
+_callArgsCache = WeakKeyDictionary()
+
+
+def _getCallArgs(klass):
+    try:
+        return _callArgsCache[klass]
+    except KeyError:
+        args = _callArgsCache[klass] = getfullargspec(klass.__call__).args
+        return args
+
+
 def isValidFilter(klass, *bases):
     """Return True if 'klass' is a valid filter class.
     A valid filter class is a class (of type 'type'), that has
@@ -113,10 +159,7 @@ def isValidFilter(klass, *bases):
         logger.error(f"{klass!r} is not callable")
         return False
     for baseClass in bases or (BaseFilter, BaseIFilter):
-        if (
-            getfullargspec(klass.__call__).args
-            == getfullargspec(baseClass.__call__).args
-        ):
+        if _getCallArgs(klass) == _getCallArgs(baseClass):
             return True
     logger.error(f"{klass!r} '__call__' method has incorrect signature")
     return False
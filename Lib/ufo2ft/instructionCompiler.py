@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import array
 import logging
-from functools import partial
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Optional
 
 from fontTools import ttLib
@@ -16,6 +16,7 @@ from fontTools.ttLib.tables._g_l_y_f import (
     USE_MY_METRICS,
     flagOverlapSimple,
 )
+from fontTools.ttLib.tables.ttProgram import Program
 
 from ufo2ft.constants import (
     OBJECT_LIBS_KEY,
@@ -34,6 +35,24 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _program_size(program: Program) -> int:
+    """Return the length of the program's bytecode, without making a copy of it
+    when the program has already been assembled."""
+    bytecode = getattr(program, "bytecode", None)
+    if bytecode is not None:
+        return len(bytecode)
+    return len(program.getBytecode())
+
+
+def _has_integer_coordinates(ttglyph: TTGlyph) -> bool:
+    """Return True if the TTGlyph is a simple glyph whose coordinates are all
+    integers."""
+    coordinates = getattr(ttglyph, "coordinates", None)
+    if coordinates is None or ttglyph.isComposite():
+        return False
+    return all(map(float.is_integer, coordinates.array))
+
+
 class InstructionCompiler:
     def __init__(
         self, ufo: Font, otf: ttLib.TTFont, autoUseMyMetrics: bool = True
@@ -44,6 +63,15 @@ class InstructionCompiler:
             # If autoUseMyMetrics is False, replace the method with a no-op
             self.autoUseMyMetrics = lambda ttGlyph, glyphName: None
 
+    @cached_property
+    def _ttGlyphSet(self):
+        """The glyph set used to draw the base glyphs of composites when hashing.
+
+        It looks glyphs up in the glyf table on demand, so one instance can be
+        shared by all hash checks, even as glyphs are added to the table.
+        """
+        return self.otf.getGlyphSet()
+
     def _check_glyph_hash(
         self, glyph: Glyph, ttglyph: TTGlyph, stored_hash: Optional[str]
     ) -> bool:
@@ -57,11 +85,17 @@ class InstructionCompiler:
             return False
 
         ttwidth = self.otf["hmtx"][glyph.name][0]
-        hash_pen = HashPointPen(ttwidth, self.otf.getGlyphSet())
-        round_pen = RoundingPointPen(
-            hash_pen, transformRoundFunc=partial(floatToFixedToFloat, precisionBits=14)
-        )
-        ttglyph.drawPoints(round_pen, self.otf["glyf"])
+        hash_pen = HashPointPen(ttwidth, self._ttGlyphSet)
+        if _has_integer_coordinates(ttglyph):
+            # Rounding would leave the points untouched, so skip the extra
+            # pen call per point
+            pen = hash_pen
+        else:
+            pen = RoundingPointPen(
+                hash_pen,
+                transformRoundFunc=partial(floatToFixedToFloat, precisionBits=14),
+            )
+        ttglyph.drawPoints(pen, self.otf["glyf"])
 
         if stored_hash != hash_pen.hash:
             logger.error(
@@ -71,6 +105,17 @@ class InstructionCompiler:
             return False
         return True
 
+    @cached_property
+    def _ttdata(self) -> Optional[dict]:
+        """The font-level TrueType instructions data from the UFO lib.
+
+        Its format version is checked once, the first time it is accessed.
+        """
+        ttdata = self.ufo.lib.get(TRUETYPE_INSTRUCTIONS_KEY, None)
+        if ttdata:
+            self._check_tt_data_format(ttdata, f"lib key '{TRUETYPE_INSTRUCTIONS_KEY}'")
+        return ttdata
+
     @staticmethod
     def _check_tt_data_format(ttdata: dict, name: str) -> None:
         """Make sure we understand the format version, currently only version 1
@@ -90,9 +135,8 @@ class InstructionCompiler:
         """Compile the program for prep or fpgm."""
         assert key in ("controlValueProgram", "fontProgram")
         assert table_tag in ("prep", "fpgm")
-        ttdata = self.ufo.lib.get(TRUETYPE_INSTRUCTIONS_KEY, None)
+        ttdata = self._ttdata
         if ttdata:
-            self._check_tt_data_format(ttdata, f"lib key '{key}'")
             asm = ttdata.get(key, None)
             if asm is None:
                 # The optional key is not there, quit right here
@@ -105,14 +149,16 @@ class InstructionCompiler:
                 )
                 return
 
-            self.otf[table_tag] = table = ttLib.newTable(table_tag)
-            table.program = ttLib.tables.ttProgram.Program()
+            self.otf[table_tag] = table = newTable(table_tag)
+            table.program = Program()
             table.program.fromAssembly(asm.splitlines())
 
     def compileGlyphInstructions(self, ttGlyph, name) -> None:
         """Compile the glyph instructions from the UFO glyph `name` to bytecode
         and add it to `ttGlyph`."""
-        if name not in self.ufo:
+        try:
+            glyph = self.ufo[name]
+        except KeyError:
             # Skip glyphs that are not in the UFO; no need to inform about '.notdef'
             # since that glyph is often auto-generated
             if name != ".notdef":
@@ -122,7 +168,6 @@ class InstructionCompiler:
                 )
             return
 
-        glyph = self.ufo[name]
         ttdata = glyph.lib.get(TRUETYPE_INSTRUCTIONS_KEY, None)
         if ttdata is not None:
             self._compile_tt_glyph_program(glyph, ttGlyph, ttdata)
@@ -154,7 +199,7 @@ class InstructionCompiler:
             logger.debug(f"Glyph '{glyph.name}' has no instructions.")
             return
 
-        ttglyph.program = ttLib.tables.ttProgram.Program()
+        ttglyph.program = Program()
         ttglyph.program.fromAssembly(asm.splitlines())
 
     def autoUseMyMetrics(self, ttGlyph, glyphName):
@@ -203,14 +248,18 @@ class InstructionCompiler:
         use_my_metrics_comp = None
         lib_contains_use_my_metrics_key = False
 
-        for i, c in enumerate(ttglyph.components):
-            # Set OVERLAP_COMPOUND on the first component only
-            if i == 0 and TRUETYPE_OVERLAP_KEY in glyph.lib:
-                if glyph.lib.get(TRUETYPE_OVERLAP_KEY, False):
-                    c.flags |= OVERLAP_COMPOUND
-                else:
-                    c.flags &= ~OVERLAP_COMPOUND
+        # Look up the glyph-level lib keys once instead of for every component
+        object_libs = glyph.lib.get(OBJECT_LIBS_KEY) or {}
+
+        # Set OVERLAP_COMPOUND on the first component only
+        if TRUETYPE_OVERLAP_KEY in glyph.lib and ttglyph.components:
+            c = ttglyph.components[0]
+            if glyph.lib[TRUETYPE_OVERLAP_KEY]:
+                c.flags |= OVERLAP_COMPOUND
+            else:
+                c.flags &= ~OVERLAP_COMPOUND
 
+        for i, c in enumerate(ttglyph.components):
             # Check if we have information about the current component in the glyph lib
             ufo_component_id = glyph.components[i].identifier
             if ufo_component_id is None:
@@ -221,17 +270,11 @@ class InstructionCompiler:
                 # - USE_MY_METRICS   is set automatically below if no component has it
                 continue
 
-            if (
-                OBJECT_LIBS_KEY in glyph.lib
-                and ufo_component_id in glyph.lib[OBJECT_LIBS_KEY]
-                and (
-                    TRUETYPE_ROUND_KEY in glyph.lib[OBJECT_LIBS_KEY][ufo_component_id]
-                    or TRUETYPE_METRICS_KEY
-                    in glyph.lib[OBJECT_LIBS_KEY][ufo_component_id]
-                )
+            component_lib = object_libs.get(ufo_component_id)
+            if component_lib is not None and (
+                TRUETYPE_ROUND_KEY in component_lib
+                or TRUETYPE_METRICS_KEY in component_lib
             ):
-                component_lib = glyph.lib[OBJECT_LIBS_KEY][ufo_component_id]
-
                 # ROUND_XY_TO_GRID
 
                 # https://github.com/googlefonts/ufo2ft/pull/425 recommends
@@ -280,7 +323,7 @@ class InstructionCompiler:
         font.
         """
         maxp = self.otf["maxp"]
-        ttdata = self.ufo.lib.get(TRUETYPE_INSTRUCTIONS_KEY, None)
+        ttdata = self._ttdata
         if ttdata:
             for name in (
                 "maxStorage",
@@ -296,19 +339,20 @@ class InstructionCompiler:
                     setattr(maxp, name, value)
 
         # Recalculate maxp.maxSizeOfInstructions
-        sizes = [
-            len(ttglyph.program.getBytecode())
-            for ttglyph in self.otf["glyf"].glyphs.values()
-            if hasattr(ttglyph, "program")
-        ]
-        maxp.maxSizeOfInstructions = max(sizes, default=0)
+        maxp.maxSizeOfInstructions = max(
+            (
+                _program_size(ttglyph.program)
+                for ttglyph in self.otf["glyf"].glyphs.values()
+                if hasattr(ttglyph, "program")
+            ),
+            default=0,
+        )
 
     def setupTable_cvt(self) -> None:
         """Make the cvt table."""
         cvts = []
-        ttdata = self.ufo.lib.get(TRUETYPE_INSTRUCTIONS_KEY, None)
+        ttdata = self._ttdata
         if ttdata:
-            self._check_tt_data_format(ttdata, "key 'controlValue'")
             cvt_dict = ttdata.get("controlValue", None)
             if cvt_dict:
                 # Convert string keys to int
@@ -1840,8 +1840,16 @@ class OutlineTTFCompiler(BaseOutlineCompiler):
         # Sort the glyphs so that simple glyphs are compiled first, and composite
         # glyphs are compiled later. Otherwise the glyph hashes may not be ready
         # to calculate when a base glyph of a composite glyph is not in the font yet.
+        # Simple glyphs keep the glyph order, so only the composites need sorting.
         maxComponentDepths = self.getMaxComponentDepths()
-        for name in sorted(self.glyphOrder, key=lambda n: maxComponentDepths.get(n, 0)):
+        simpleGlyphs, compositeGlyphs = [], []
+        for name in self.glyphOrder:
+            if name in maxComponentDepths:
+                compositeGlyphs.append(name)
+            else:
+                simpleGlyphs.append(name)
+        compositeGlyphs.sort(key=maxComponentDepths.__getitem__)
+        for name in simpleGlyphs + compositeGlyphs:
             ttGlyph = ttGlyphs[name]
             self.instructionCompiler.compileGlyphInstructions(ttGlyph, name)
             glyf[name] = ttGlyph
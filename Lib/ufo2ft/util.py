@@ -541,8 +541,8 @@ _pluginSpecRE = re.compile(
 
 def _loadPluginFromString(spec, moduleName, isValidFunc):
     spec = spec.strip()
-    m = _pluginSpecRE.match(spec)
-    if not m or (m.end() - m.start()) != len(spec):
+    m = _pluginSpecRE.fullmatch(spec)
+    if not m:
         raise ValueError(spec)
     moduleName = m.group(1) or moduleName
     className = m.group(2)
@@ -57,8 +57,7 @@ def layertestbdufo(FontClass):
     return font
 
 
-@pytest.fixture
-def designspace(layertestrgufo, layertestbdufo):
+def _make_layertest_designspace(layertestrgufo, layertestbdufo):
     ds = designspaceLib.DesignSpaceDocument()
 
     a1 = designspaceLib.AxisDescriptor()
@@ -99,6 +98,21 @@ def designspace(layertestrgufo, layertestbdufo):
     return ds
 
 
+@pytest.fixture
+def designspace(layertestrgufo, layertestbdufo):
+    return _make_layertest_designspace(layertestrgufo, layertestbdufo)
+
+
+@pytest.fixture(scope="session")
+def shared_designspace(FontClass):
+    # Same as 'designspace' but loaded once per session: only use it in tests
+    # that don't modify the designspace or its source fonts.
+    return _make_layertest_designspace(
+        FontClass(getpath("LayerFont-Regular.ufo")),
+        FontClass(getpath("LayerFont-Bold.ufo")),
+    )
+
+
 @pytest.fixture
 def designspace_v5(FontClass):
     def draw_rectangle(pen, x_offset, y_offset):
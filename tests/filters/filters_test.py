@@ -1,3 +1,6 @@
+import subprocess
+import sys
+from textwrap import dedent
 from types import SimpleNamespace
 
 import pytest
@@ -254,7 +257,22 @@ def test_BaseFilter_repr():
     ) == "FooBarFilter('g', 'h', c=0, include={})".format(repr(f))
 
 
-if __name__ == "__main__":
-    import sys
+def test_lazy_filter_attributes():
+    # Run in a fresh interpreter, where no filter module has been imported yet
+    code = dedent(
+        """
+        import ufo2ft.filters
+        from ufo2ft.filters.transformations import TransformationsFilter
+
+        assert ufo2ft.filters.TransformationsFilter is TransformationsFilter
+        assert "cubicToQuadratic" in dir(ufo2ft.filters)
+        assert ufo2ft.filters.cubicToQuadratic.__name__ == (
+            "ufo2ft.filters.cubicToQuadratic"
+        )
+        """
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
 
+if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
@@ -98,6 +98,17 @@ class InstructionCompilerTest:
         result = ic._check_glyph_hash(glyph, ttglyph, ufo_hash)
         assert result
 
+    def test_check_glyph_hash_float_coordinates(self, quaduforeversed, quadfont):
+        glyph = quaduforeversed["a"]
+        ufo_hash = get_hash_ufo(glyph, quaduforeversed)
+        ttglyph = quadfont["glyf"]["a"]
+
+        # Unrounded coordinates must be rounded before hashing
+        ttglyph.coordinates.translate((0.25, -0.25))
+
+        ic = InstructionCompiler(quaduforeversed, quadfont)
+        assert ic._check_glyph_hash(glyph, ttglyph, ufo_hash)
+
     def test_check_glyph_hash_missing(self, quaduforeversed, quadfont):
         glyph = quaduforeversed["a"]
 
@@ -615,6 +626,54 @@ class InstructionCompilerTest:
         else:
             assert not ttglyph.flags[0] & flagOverlapSimple
 
+    # _ttdata
+
+    @pytest.mark.parametrize(
+        "method",
+        ["setupTable_cvt", "setupTable_fpgm", "setupTable_prep", "update_maxp"],
+    )
+    def test_ttdata_unknown_format(self, quaduforeversed, quadfont, method):
+        ic = InstructionCompiler(quaduforeversed, quadfont)
+        ic.ufo.lib[TRUETYPE_INSTRUCTIONS_KEY] = {
+            "formatVersion": "2",
+            "controlValue": {"1": 500},
+            "fontProgram": "PUSHB[]\n0\nFDEF[]\nPOP[]\nENDF[]",
+        }
+        with pytest.raises(
+            NotImplementedError,
+            match=(
+                "Unknown formatVersion 2 for instructions in lib key "
+                "'public.truetype.instructions'."
+            ),
+        ):
+            getattr(ic, method)()
+
+    def test_ttdata_checked_once(self, quaduforeversed, quadfont, monkeypatch):
+        checked = []
+        check_tt_data_format = InstructionCompiler._check_tt_data_format
+
+        def check(ttdata, name):
+            checked.append(name)
+            check_tt_data_format(ttdata, name)
+
+        monkeypatch.setattr(
+            InstructionCompiler, "_check_tt_data_format", staticmethod(check)
+        )
+        ic = InstructionCompiler(quaduforeversed, quadfont)
+        ic.ufo.lib[TRUETYPE_INSTRUCTIONS_KEY] = {
+            "formatVersion": "1",
+            "controlValue": {"1": 500},
+            "controlValueProgram": "PUSHW[]\n511\nSCANCTRL[]",
+            "fontProgram": "PUSHB[]\n0\nFDEF[]\nPOP[]\nENDF[]",
+        }
+        ic.setupTable_cvt()
+        ic.setupTable_fpgm()
+        ic.setupTable_prep()
+        ic.update_maxp()
+
+        assert {"cvt ", "fpgm", "prep"}.issubset(ic.otf.keys())
+        assert checked == ["lib key 'public.truetype.instructions'"]
+
     # update_maxp
 
     def test_update_maxp_no_ttdata(self, quaduforeversed, quadfont):
@@ -1,5 +1,7 @@
 import difflib
+import functools
 import io
+import itertools
 import logging
 import os
 import re
@@ -31,44 +33,60 @@ from ufo2ft.constants import KEEP_GLYPH_NAMES, TRUETYPE_OVERLAP_KEY
 from ufo2ft.errors import InvalidFontData
 from ufo2ft.filters import TransformationsFilter
 
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
 
 def getpath(filename):
-    dirname = os.path.dirname(__file__)
-    return os.path.join(dirname, "data", filename)
+    return os.path.join(_DATA_DIR, filename)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def testufo(FontClass):
+    # Shared by all the tests, which must not modify it. Tests that need to
+    # change the UFO before compiling it load their own copy with FontClass.
     return FontClass(getpath("TestFont.ufo"))
 
 
-def readLines(f):
-    f.seek(0)
-    lines = []
-    for line in f.readlines():
-        # Elide ttLibVersion because it frequently changes.
-        # Use os-native line separators so we can run difflib.
-        if line.startswith("<ttFont "):
-            lines.append("<ttFont>" + os.linesep)
-        else:
-            lines.append(line.rstrip() + os.linesep)
-    return lines
+_TTFONT_RE = re.compile(r"^<ttFont [^>]*>", re.M)
+
+
+def _elideVersion(data):
+    # Elide ttLibVersion because it frequently changes.
+    return _TTFONT_RE.sub("<ttFont>", data, count=1)
+
+
+def readLines(data):
+    # Use os-native line separators so we can run difflib.
+    return [line.rstrip() + os.linesep for line in data.splitlines()]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_expected(path):
+    with open(path, encoding="utf-8") as f:
+        return _elideVersion(f.read())
 
 
 def expectTTX(font, expectedTTX, tables=None):
-    with open(getpath(expectedTTX), encoding="utf-8") as f:
-        expected = readLines(f)
     font.recalcTimestamp = False
     font["head"].created, font["head"].modified = 3570196637, 3601822698
     font["head"].checkSumAdjustment = 0x12345678
     f = io.StringIO()
     font.saveXML(f, tables=tables)
 
-    actual = readLines(f)
+    # Usually the whole text matches, so only split it into normalized lines
+    # when it doesn't.
+    expected = _load_expected(getpath(expectedTTX))
+    actual = _elideVersion(f.getvalue())
+    if actual == expected:
+        return
+    expected = readLines(expected)
+    actual = readLines(actual)
     if actual != expected:
-        for line in difflib.unified_diff(
+        # Only print the start of the diff, which is enough to see what's wrong.
+        diff = difflib.unified_diff(
             expected, actual, fromfile=expectedTTX, tofile="<generated>"
-        ):
+        )
+        for line in itertools.islice(diff, 1000):
             sys.stderr.write(line)
         pytest.fail("TTX output is different from expected")
 
@@ -130,21 +148,27 @@ class IntegrationTest:
         ttf = compileTTF(ufo)
         expectTTX(ttf, "MTIFeatures.ttx", tables=self._layoutTables)
 
-    def test_removeOverlaps_CFF(self, testufo):
-        otf = compileOTF(testufo, removeOverlaps=True)
-        expectTTX(otf, "TestFont-NoOverlaps-CFF.ttx")
-
-    def test_removeOverlaps_CFF_pathops(self, testufo):
-        otf = compileOTF(testufo, removeOverlaps=True, overlapsBackend="pathops")
-        expectTTX(otf, "TestFont-NoOverlaps-CFF-pathops.ttx")
-
-    def test_removeOverlaps(self, testufo):
-        ttf = compileTTF(testufo, removeOverlaps=True)
-        expectTTX(ttf, "TestFont-NoOverlaps-TTF.ttx")
-
-    def test_removeOverlaps_pathops(self, testufo):
-        ttf = compileTTF(testufo, removeOverlaps=True, overlapsBackend="pathops")
-        expectTTX(ttf, "TestFont-NoOverlaps-TTF-pathops.ttx")
+    @pytest.mark.parametrize(
+        "compile_func, options, expected_ttx",
+        [
+            (compileOTF, {}, "TestFont-NoOverlaps-CFF.ttx"),
+            (
+                compileOTF,
+                {"overlapsBackend": "pathops"},
+                "TestFont-NoOverlaps-CFF-pathops.ttx",
+            ),
+            (compileTTF, {}, "TestFont-NoOverlaps-TTF.ttx"),
+            (
+                compileTTF,
+                {"overlapsBackend": "pathops"},
+                "TestFont-NoOverlaps-TTF-pathops.ttx",
+            ),
+        ],
+        ids=["CFF", "CFF-pathops", "TTF", "TTF-pathops"],
+    )
+    def test_removeOverlaps(self, testufo, compile_func, options, expected_ttx):
+        font = compile_func(testufo, removeOverlaps=True, **options)
+        expectTTX(font, expected_ttx)
 
     def test_nestedComponents(self, FontClass):
         ufo = FontClass(getpath("NestedComponents-Regular.ufo"))
@@ -180,22 +204,80 @@ class IntegrationTest:
         expectTTX(ttfs[0], "TestFont.ttx")
         expectTTX(ttfs[1], "TestFont.ttx")
 
-    @pytest.mark.parametrize(
-        "cff_version, expected_ttx",
-        [(1, "TestFont-NoOptimize-CFF.ttx"), (2, "TestFont-NoOptimize-CFF2.ttx")],
-        ids=["cff1", "cff2"],
-    )
-    def test_optimizeCFF_none(self, testufo, cff_version, expected_ttx):
-        otf = compileOTF(testufo, optimizeCFF=0, cffVersion=cff_version)
-        expectTTX(otf, expected_ttx)
+    def test_interpolatableTTFs_numProcesses(self, FontClass, ufo_module):
+        if ufo_module.__name__ == "defcon":
+            pytest.skip("defcon fonts cannot be pickled")
+        ufos = [FontClass(getpath("TestFont.ufo")) for _ in range(2)]
+        ttfs = list(compileInterpolatableTTFs(ufos, numProcesses=2))
+        expectTTX(ttfs[0], "TestFont.ttx")
+        expectTTX(ttfs[1], "TestFont.ttx")
+
+    def test_interpolatableTTFs_numProcesses_not_picklable(self, FontClass, ufo_module):
+        if ufo_module.__name__ != "defcon":
+            pytest.skip("only defcon fonts cannot be pickled")
+        ufos = [FontClass(getpath("TestFont.ufo")) for _ in range(2)]
+        with pytest.raises(
+            ValueError,
+            match="numProcesses=2 requires picklable .* the UFO of source",
+        ):
+            list(compileInterpolatableTTFs(ufos, numProcesses=2))
+
+    def test_interpolatableTTFs_numProcesses_invalid(self, FontClass):
+        ufos = [FontClass(getpath("TestFont.ufo")) for _ in range(2)]
+        with pytest.raises(ValueError, match="numProcesses must be at least 1"):
+            list(compileInterpolatableTTFs(ufos, numProcesses=0))
+
+    def test_interpolatableTTFs_numProcesses_mti_features(self, FontClass, ufo_module):
+        if ufo_module.__name__ == "defcon":
+            pytest.skip("defcon fonts cannot be pickled")
+
+        def loadUFOs():
+            # Only the second master has MTI feature files; like when compiling
+            # serially, the feature compiler picked for the first one is used
+            ufos = [FontClass(getpath("MTIFeatures.ufo")) for _ in range(2)]
+            for fileName in list(ufos[0].data.fileNames):
+                del ufos[0].data[fileName]
+            return ufos
+
+        expected = list(compileInterpolatableTTFs(loadUFOs()))
+        ttfs = list(compileInterpolatableTTFs(loadUFOs(), numProcesses=2))
+        assert ["GSUB" in ttf for ttf in ttfs] == ["GSUB" in ttf for ttf in expected]
+
+    def test_interpolatableTTFs_numProcesses_debugFeatureFile(self, FontClass):
+        # Writing to the debug feature file falls back to compiling serially,
+        # so this works even with fonts that cannot be pickled.
+        ufos = [
+            FontClass(getpath("LayerFont-Regular.ufo")),
+            FontClass(getpath("LayerFont-Bold.ufo")),
+        ]
+        expected = io.StringIO()
+        list(compileInterpolatableTTFs(ufos, debugFeatureFile=expected))
+        tmp = io.StringIO()
+        ttfs = list(
+            compileInterpolatableTTFs(ufos, debugFeatureFile=tmp, numProcesses=2)
+        )
+        assert len(ttfs) == 2
+        assert tmp.getvalue() == expected.getvalue()
+        assert "### LayerFont-Bold ###" in tmp.getvalue()
+
+    def test_compileVariableTTF_numProcesses(self, shared_designspace, ufo_module):
+        if ufo_module.__name__ == "defcon":
+            pytest.skip("defcon fonts cannot be pickled")
+        varfont = compileVariableTTF(shared_designspace, numProcesses=2)
+        expectTTX(varfont, "TestVariableFont-TTF.ttx")
 
     @pytest.mark.parametrize(
-        "cff_version, expected_ttx",
-        [(1, "TestFont-Specialized-CFF.ttx"), (2, "TestFont-Specialized-CFF2.ttx")],
-        ids=["cff1", "cff2"],
+        "optimize_cff, cff_version, expected_ttx",
+        [
+            (0, 1, "TestFont-NoOptimize-CFF.ttx"),
+            (0, 2, "TestFont-NoOptimize-CFF2.ttx"),
+            (1, 1, "TestFont-Specialized-CFF.ttx"),
+            (1, 2, "TestFont-Specialized-CFF2.ttx"),
+        ],
+        ids=["none-cff1", "none-cff2", "specialize-cff1", "specialize-cff2"],
     )
-    def test_optimizeCFF_specialize(self, testufo, cff_version, expected_ttx):
-        otf = compileOTF(testufo, optimizeCFF=1, cffVersion=cff_version)
+    def test_optimizeCFF(self, testufo, optimize_cff, cff_version, expected_ttx):
+        otf = compileOTF(testufo, optimizeCFF=optimize_cff, cffVersion=cff_version)
         expectTTX(otf, expected_ttx)
 
     @pytest.mark.parametrize(
@@ -225,8 +307,10 @@ class IntegrationTest:
         )
         expectTTX(otf, expected_ttx)
 
-    def test_compileVariableTTF(self, designspace, useProductionNames):
-        varfont = compileVariableTTF(designspace, useProductionNames=useProductionNames)
+    def test_compileVariableTTF(self, shared_designspace, useProductionNames):
+        varfont = compileVariableTTF(
+            shared_designspace, useProductionNames=useProductionNames
+        )
         expectTTX(
             varfont,
             "TestVariableFont-TTF{}.ttx".format(
@@ -234,9 +318,9 @@ class IntegrationTest:
             ),
         )
 
-    def test_compileVariableCFF2(self, designspace, useProductionNames):
+    def test_compileVariableCFF2(self, shared_designspace, useProductionNames):
         varfont = compileVariableCFF2(
-            designspace, useProductionNames=useProductionNames
+            shared_designspace, useProductionNames=useProductionNames
         )
         expectTTX(
             varfont,
@@ -245,14 +329,14 @@ class IntegrationTest:
             ),
         )
 
-    def test_compileVariableCFF2_subroutinized(self, designspace):
-        varfont = compileVariableCFF2(designspace, optimizeCFF=2)
+    def test_compileVariableCFF2_subroutinized(self, shared_designspace):
+        varfont = compileVariableCFF2(shared_designspace, optimizeCFF=2)
         expectTTX(varfont, "TestVariableFont-CFF2-cffsubr.ttx")
 
-    def test_debugFeatureFile(self, designspace):
+    def test_debugFeatureFile(self, shared_designspace):
         tmp = io.StringIO()
 
-        _ = compileVariableTTF(designspace, debugFeatureFile=tmp)
+        _ = compileVariableTTF(shared_designspace, debugFeatureFile=tmp)
         assert "\n" + tmp.getvalue() == dedent(
             """
             markClass dotabovecomb <anchor -2 465> @MC_top;
@@ -272,31 +356,32 @@ class IntegrationTest:
         )
 
     @pytest.mark.parametrize(
-        "output_format, options, expected_ttx",
+        "compile_func, options, expected_ttx",
         [
-            ("TTF", {}, "TestFont-TTF-post3.ttx"),
-            ("OTF", {"cffVersion": 2}, "TestFont-CFF2-post3.ttx"),
+            (compileTTF, {}, "TestFont-TTF-post3.ttx"),
+            (compileOTF, {"cffVersion": 2}, "TestFont-CFF2-post3.ttx"),
         ],
+        ids=["TTF", "OTF"],
     )
-    def test_drop_glyph_names(self, testufo, output_format, options, expected_ttx):
-        testufo.lib[KEEP_GLYPH_NAMES] = False
-        compile_func = globals()[f"compile{output_format}"]
-        ttf = compile_func(testufo, **options)
+    def test_drop_glyph_names(self, FontClass, compile_func, options, expected_ttx):
+        ufo = FontClass(getpath("TestFont.ufo"))
+        ufo.lib[KEEP_GLYPH_NAMES] = False
+        ttf = compile_func(ufo, **options)
         expectTTX(ttf, expected_ttx)
 
     @pytest.mark.parametrize(
-        "output_format, options, expected_ttx",
+        "compile_func, options, expected_ttx",
         [
-            ("VariableTTF", {}, "TestVariableFont-TTF-post3.ttx"),
-            ("VariableCFF2", {}, "TestVariableFont-CFF2-post3.ttx"),
+            (compileVariableTTF, {}, "TestVariableFont-TTF-post3.ttx"),
+            (compileVariableCFF2, {}, "TestVariableFont-CFF2-post3.ttx"),
         ],
+        ids=["VariableTTF", "VariableCFF2"],
     )
     def test_drop_glyph_names_variable(
-        self, designspace, output_format, options, expected_ttx
+        self, designspace, compile_func, options, expected_ttx
     ):
         # set keepGlyphNames in the default UFO.lib where postProcessor finds it
         designspace.findDefault().font.lib[KEEP_GLYPH_NAMES] = False
-        compile_func = globals()[f"compile{output_format}"]
         ttf = compile_func(designspace, **options)
         expectTTX(ttf, expected_ttx)
 
@@ -333,11 +418,11 @@ class IntegrationTest:
             compileVariableCFF2,
         ],
     )
-    def test_compileVariable_filters(self, designspace, compileFunc):
+    def test_compileVariable_filters(self, shared_designspace, compileFunc):
         filters = [TransformationsFilter(OffsetY=10)]
-        varfont = compileFunc(designspace, filters=filters)
+        varfont = compileFunc(shared_designspace, filters=filters)
 
-        ufo = designspace.sources[0].font
+        ufo = shared_designspace.sources[0].font
         pen1 = BoundsPen(ufo)
         glyph = ufo["a"]
         glyph.draw(pen1)
@@ -504,11 +589,12 @@ class IntegrationTest:
 
         assert vf["head"].glyphDataFormat == 1
 
-    def test_compileTTF_overlap_simple_flag(self, testufo):
+    def test_compileTTF_overlap_simple_flag(self, FontClass):
         """Test that the OVERLAP_{SIMPLE,COMPOUND} are set on glyphs that have it"""
-        testufo["a"].lib = {TRUETYPE_OVERLAP_KEY: True}
-        testufo["h"].lib = {TRUETYPE_OVERLAP_KEY: True}
-        ttf = compileTTF(testufo, useProductionNames=False)
+        ufo = FontClass(getpath("TestFont.ufo"))
+        ufo["a"].lib = {TRUETYPE_OVERLAP_KEY: True}
+        ufo["h"].lib = {TRUETYPE_OVERLAP_KEY: True}
+        ttf = compileTTF(ufo, useProductionNames=False)
 
         # OVERLAP_SIMPLE is set on 'a' but not on 'b'
         assert ttf["glyf"]["a"].flags[0] & flagOverlapSimple
@@ -1,3 +1,4 @@
+import itertools
 import logging
 import os
 
@@ -19,27 +20,41 @@ from ufo2ft.preProcessor import (
     _init_explode_color_layer_glyphs_filter,
 )
 
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
 
 def getpath(filename):
-    dirname = os.path.dirname(__file__)
-    return os.path.join(dirname, "data", filename)
+    return os.path.join(_DATA_DIR, filename)
+
+
+@pytest.fixture(scope="session")
+def testufo(FontClass):
+    # Shared by the tests below that don't modify the UFO, e.g. because they
+    # process it with inplace=False. Tests that modify it load their own copy.
+    return FontClass(getpath("TestFont.ufo"))
+
+
+@pytest.fixture(scope="session")
+def testufos(FontClass):
+    # Two distinct shared copies of TestFont.ufo, for the read-only tests that
+    # process a pair of UFOs.
+    return (FontClass(getpath("TestFont.ufo")), FontClass(getpath("TestFont.ufo")))
 
 
 def glyph_has_qcurve(ufo, glyph_name):
     return any(
-        s.segmentType == "qcurve" for contour in ufo[glyph_name] for s in contour
+        s.segmentType == "qcurve"
+        for s in itertools.chain.from_iterable(ufo[glyph_name])
     )
 
 
 class TTFPreProcessorTest:
-    def test_no_inplace(self, FontClass):
-        ufo = FontClass(getpath("TestFont.ufo"))
-
-        glyphSet = TTFPreProcessor(ufo, inplace=False).process()
+    def test_no_inplace(self, testufo):
+        glyphSet = TTFPreProcessor(testufo, inplace=False).process()
 
-        assert not glyph_has_qcurve(ufo, "c")
+        assert not glyph_has_qcurve(testufo, "c")
         assert glyph_has_qcurve(glyphSet, "c")
-        assert CURVE_TYPE_LIB_KEY not in ufo.layers.defaultLayer.lib
+        assert CURVE_TYPE_LIB_KEY not in testufo.layers.defaultLayer.lib
 
     def test_inplace_remember_curve_type(self, FontClass, caplog):
         caplog.set_level(logging.ERROR)
@@ -91,20 +106,18 @@ class TTFPreProcessorTest:
         assert (glyphSets0["a"][0][0].x - glyphSets1["a"][0][0].x) == -40
         assert (glyphSets1["a"][0][0].y - glyphSets0["a"][0][0].y) == 10
 
-    def test_custom_filters_as_argument(self, FontClass):
+    def test_custom_filters_as_argument(self, testufos):
         from ufo2ft.filters import RemoveOverlapsFilter, TransformationsFilter
 
-        ufo1 = FontClass(getpath("TestFont.ufo"))
-        ufo2 = FontClass(getpath("TestFont.ufo"))
         filter1 = RemoveOverlapsFilter(backend="pathops")
         filter2 = TransformationsFilter(include=["d"], pre=True, OffsetY=-200)
         filter3 = TransformationsFilter(OffsetX=10)
 
         glyphSets0 = TTFPreProcessor(
-            ufo1, filters=[filter1, filter2, filter3]
+            testufos[0], filters=[filter1, filter2, filter3]
         ).process()
         glyphSets1 = TTFPreProcessor(
-            ufo2, filters=[filter1, filter2, filter3]
+            testufos[1], filters=[filter1, filter2, filter3]
         ).process()
 
         # Both UFOs have the same filters applied
@@ -131,11 +144,9 @@ class TTFPreProcessorTest:
         a = glyphSet["a"]
         assert (a[0][0].x, a[0][0].y) == (ufo["a"][0][0].x + 10, ufo["a"][0][0].y - 10)
 
-    def test_no_convertCubics_reverseDirection(self, FontClass):
-        ufo = FontClass(getpath("TestFont.ufo"))
-
+    def test_no_convertCubics_reverseDirection(self, testufo):
         glyphSet = TTFPreProcessor(
-            ufo, convertCubics=False, reverseDirection=True
+            testufo, convertCubics=False, reverseDirection=True
         ).process()
 
         contours = [contour for contour in glyphSet["c"]]
@@ -147,21 +158,17 @@ class TTFPreProcessorTest:
 
 
 class TTFInterpolatablePreProcessorTest:
-    def test_no_inplace(self, FontClass):
-        ufo1 = FontClass(getpath("TestFont.ufo"))
-        ufo2 = FontClass(getpath("TestFont.ufo"))
-        ufos = [ufo1, ufo2]
-
-        assert CURVE_TYPE_LIB_KEY not in ufo1.lib
-        assert CURVE_TYPE_LIB_KEY not in ufo1.layers.defaultLayer.lib
-        assert not glyph_has_qcurve(ufo1, "c")
+    def test_no_inplace(self, testufos):
+        assert CURVE_TYPE_LIB_KEY not in testufos[0].lib
+        assert CURVE_TYPE_LIB_KEY not in testufos[0].layers.defaultLayer.lib
+        assert not glyph_has_qcurve(testufos[0], "c")
 
-        glyphSets = TTFInterpolatablePreProcessor(ufos, inplace=False).process()
+        glyphSets = TTFInterpolatablePreProcessor(testufos, inplace=False).process()
 
         for i in range(2):
             assert glyph_has_qcurve(glyphSets[i], "c")
-            assert CURVE_TYPE_LIB_KEY not in ufos[i].lib
-            assert CURVE_TYPE_LIB_KEY not in ufos[i].layers.defaultLayer.lib
+            assert CURVE_TYPE_LIB_KEY not in testufos[i].lib
+            assert CURVE_TYPE_LIB_KEY not in testufos[i].layers.defaultLayer.lib
 
     def test_inplace_remember_curve_type(self, FontClass):
         ufo1 = FontClass(getpath("TestFont.ufo"))
@@ -210,18 +217,15 @@ class TTFInterpolatablePreProcessorTest:
         assert (glyphSets[0]["a"][0][0].x - glyphSets[1]["a"][0][0].x) == -40
         assert (glyphSets[1]["a"][0][0].y - glyphSets[0]["a"][0][0].y) == 10
 
-    def test_custom_filters_as_argument(self, FontClass):
-        ufo1 = FontClass(getpath("TestFont.ufo"))
-        ufo2 = FontClass(getpath("TestFont.ufo"))
+    def test_custom_filters_as_argument(self, testufos):
         filter1 = loadFilterFromString("RemoveOverlapsFilter(backend='pathops')")
         filter2 = loadFilterFromString(
             "TransformationsFilter(OffsetY=-200, include=['d'], pre=True)"
         )
         filter3 = loadFilterFromString("TransformationsFilter(OffsetX=10)")
-        ufos = [ufo1, ufo2]
 
         glyphSets = TTFInterpolatablePreProcessor(
-            ufos,
+            testufos,
             filters=[filter1, filter2, filter3],
         ).process()
 
@@ -262,12 +266,9 @@ class TTFInterpolatablePreProcessorTest:
             ufo2["a"][0][0].y - 10,
         )
 
-    def test_no_convertCubics_reverseDirection(self, FontClass):
-        ufo1 = FontClass(getpath("TestFont.ufo"))
-        ufo2 = FontClass(getpath("TestFont.ufo"))
-
+    def test_no_convertCubics_reverseDirection(self, testufos):
         glyphSets = TTFInterpolatablePreProcessor(
-            [ufo1, ufo2], convertCubics=False, reverseDirection=True
+            testufos, convertCubics=False, reverseDirection=True
         ).process()
 
         for glyphSet in glyphSets: